@@ -1,3 +1,5 @@
+import os
+
 from huggingface_hub import snapshot_download
 
 # The Model ID
@@ -6,12 +8,15 @@ repo_id = "pnnbao-ump/VieNeu-TTS"
 # Your target local directory
 local_dir = "/home/psilab/ai-content-worflow/models/VieNeu-TTS"
 
-# Download the model
-print(f"Downloading {repo_id} to {local_dir}...")
-snapshot_download(
-    repo_id=repo_id,
-    local_dir=local_dir,
-    local_dir_use_symlinks=False
-)
-
-print("Download complete.")
\ No newline at end of file
+# Skip the network round-trip entirely when the snapshot is already on disk;
+# an unconditional snapshot_download re-validates every file hash over HTTP.
+if os.path.exists(os.path.join(local_dir, "config.json")):
+    print(f"{repo_id} already present at {local_dir}, skipping download.")
+else:
+    print(f"Downloading {repo_id} to {local_dir}...")
+    snapshot_download(
+        repo_id=repo_id,
+        local_dir=local_dir,
+        max_workers=8
+    )
+    print("Download complete.")
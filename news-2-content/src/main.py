@@ -6,8 +6,9 @@ This is the entry point that coordinates the audio generation pipeline.
 import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from core import NewsProcessor
+from core import NewsProcessor, _RE_SENT
 from media import MediaGenerator
 
 
@@ -22,19 +23,22 @@ class TikTokNewsGenerator:
     4. Export metadata and summaries
     '''
     
-    def __init__(self, voice: str = "binh", summarization: bool = True, custom_audio: str = None, output_dir: str = "output"):
+    def __init__(self, voice: str = "binh", summarization: bool = True, custom_audio: str = None,
+                 output_dir: str = "output", parallel_text: bool = True):
         '''
         Initialize the audio generator.
-        
+
         Args:
             voice: Voice name for TTS
             summarization: Whether to summarize content
             custom_audio: Path to custom audio file (skips TTS generation)
             output_dir: Base directory for all outputs
+            parallel_text: Overlap GPU correction with Ollama refinement on split halves
         '''
         self.summarization = summarization
         self.custom_audio = custom_audio
         self.output_dir = output_dir
+        self.parallel_text = parallel_text
         
         print("\n" + "="*60)
         print("Initializing TikTok News Audio Generator...")
@@ -86,9 +90,7 @@ class TikTokNewsGenerator:
         
         # Step 3: Correct and refine text
         print("\n🔧 Step 3: Correcting and refining text...")
-        body = self.processor.correct_text(body)
-        body = self.processor.refine_text(body)
-        body = self._final_cleanup(body)
+        body = self._process_text(body)
         print(f"   ✓ Final body: {len(body.split())} words")
         
         # Step 4: Add intro and outro
@@ -124,23 +126,37 @@ class TikTokNewsGenerator:
         print(f"{'='*60}\n")
         
         return audio_path
-    
-    def _final_cleanup(self, text: str) -> str:
-        '''Final text cleanup - always runs.'''
-        import re
-        while re.search(r'(\d+)\.\s*(\d{3})', text):
-            text = re.sub(r'(\d+)\.\s*(\d{3})', r'\1\2', text)
-        text = re.sub(r',([^\s])', r', \1', text)
-        text = re.sub(r'([nN])([kK]hởi)', r'\1 \2', text)
-        text = re.sub(r'(án|ến|ông|ình|ất|ệt|ực)([a-zàáảãạăắằẳẵặâấầẩẫậèéẻẽẹêếềểễệìíỉĩịòóỏõọôốồổỗộơớờởỡợùúủũụưứừửữựỳýỷỹỵđ]{2,})', r'\1 \2', text)
-        text = re.sub(r'([a-zàáảãạăắằẳẵặâấầẩẫậèéẻẽẹêếềểễệìíỉĩịòóỏõọôốồổỗộơớờởỡợùúủũụưứừửữựỳýỷỹỵđ])([A-ZÀÁẢÃẠĂẮẰẲẴẶÂẤẦẨẪẬÈÉẺẼẸÊẾỀỂỄỆÌÍỈĨỊÒÓỎÕỌÔỐỒỔỖỘƠỚỜỞỠỢÙÚỦŨỤƯỨỪỬỮỰỲÝỶỸỴĐ])', r'\1 \2', text)
-        text = re.sub(r'\b(\d{1,2})/(\d{1,2})/(\d{4})\b', lambda m: f"{'mùng' if int(m.group(1))<=10 else 'ngày'} {m.group(1)} tháng {m.group(2)} năm {m.group(3)}", text)
-        text = re.sub(r'\b(\d{1,2})/(\d{1,2})\b', lambda m: f"{'mùng' if int(m.group(1))<=10 else 'ngày'} {m.group(1)} tháng {m.group(2)}", text)
-        text = re.sub(r'\s+', ' ', text).strip()
-        if text and text[-1] not in '.!?':
-            last = max(text.rfind('.'), text.rfind('!'), text.rfind('?'))
-            text = text[:last+1] if last > len(text)*0.7 else text + '.'
-        return text
+
+    def _process_text(self, body: str) -> str:
+        '''Correct and refine the body, overlapping GPU and Ollama work when possible.
+
+        The corrector runs on the local GPU while refinement blocks on the Ollama
+        server, so split halves can ping-pong between the disjoint resources.
+        Set parallel_text=False to process the whole body sequentially.
+        '''
+        if not self.parallel_text:
+            return self.processor.refine_text(self.processor.correct_text(body))
+
+        sentences = _RE_SENT.split(body)
+        if len(sentences) < 4:
+            return self.processor.refine_text(self.processor.correct_text(body))
+
+        mid = len(sentences) // 2
+        half_a, half_b = ' '.join(sentences[:mid]), ' '.join(sentences[mid:])
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Pass 1: GPU corrects half A while Ollama refines half B
+            fut_a = executor.submit(self.processor.correct_text, half_a)
+            fut_b = executor.submit(self.processor.refine_text, half_b)
+            half_a, half_b = fut_a.result(), fut_b.result()
+            # Pass 2: swap resources so both halves get both stages
+            fut_a = executor.submit(self.processor.refine_text, half_a)
+            fut_b = executor.submit(self.processor.correct_text, half_b)
+            half_a, half_b = fut_a.result(), fut_b.result()
+
+        # Half B ends on the corrector, whose output is never normalized, so
+        # clean the stitched result to keep refine_text's always-normalized invariant
+        return self.processor._clean_text(f"{half_a} {half_b}")
 
 
 def main():
@@ -157,6 +173,8 @@ def main():
     parser.add_argument('--summarization', type=str, default='yes', choices=['yes', 'no'],
                        help='Enable/disable content summarization')
     parser.add_argument('--audio', type=str, help='Path to custom audio file (skips TTS generation)')
+    parser.add_argument('--parallel-text', type=str, default='yes', choices=['yes', 'no'],
+                       help='Overlap text correction and refinement (no = strict sequential order)')
     args = parser.parse_args()
     
     print("Available voices:")
@@ -174,7 +192,8 @@ def main():
         voice=args.voice,
         summarization=(args.summarization.lower() == 'yes'),
         custom_audio=args.audio,
-        output_dir=args.dir
+        output_dir=args.dir,
+        parallel_text=(args.parallel_text.lower() == 'yes')
     )
     
     try:
@@ -4,10 +4,19 @@ Media Module - TTS audio generation.
 This module handles voice synthesis for Vietnamese text-to-speech.
 """
 import os
+import re
 import subprocess
+import numpy as np
 import torch
 import soundfile as sf
 
+try:
+    import lameenc
+except ImportError:
+    lameenc = None
+
+_RE_SENT = re.compile(r'(?<=[.!?])\s+')
+
 
 class MediaGenerator:
     '''
@@ -27,6 +36,8 @@ class MediaGenerator:
         self.voice_name = voice
         self.tts = None
         self.current_voice = None
+        self.device = "cpu"
+        self._voice_emb = None
         self._init_tts()
         print(f"✓ MediaGenerator initialized (Voice: {voice})")
     
@@ -59,7 +70,15 @@ class MediaGenerator:
                     if v in available:
                         self.current_voice = self.tts.get_preset_voice(v)
                         break
-            
+
+            self.device = device
+            # Encode the reference voice once up front; otherwise infer() redoes it per call
+            if self.current_voice is not None and hasattr(self.tts, 'encode_voice'):
+                try:
+                    self._voice_emb = self.tts.encode_voice(self.current_voice)
+                except Exception:
+                    self._voice_emb = None
+
             print(f"   ✓ VieNeu-TTS ready ({device.upper()} mode)")
         except Exception as e:
             print(f"   ✗ VieNeu-TTS init failed: {e}")
@@ -80,28 +99,87 @@ class MediaGenerator:
             raise RuntimeError("VieNeu-TTS not initialized")
         
         clean_text = text.replace("... ", ". ").replace(" ... ", ". ")
-        audio = self.tts.infer(text=clean_text, voice=self.current_voice, temperature=0.8, top_k=50)
+        sentences = [s for s in _RE_SENT.split(clean_text) if s.strip()]
+        audio = self._infer_sentences(sentences) if len(sentences) > 1 else self._infer(clean_text)
         
         if output_path.endswith('.mp3'):
-            temp_wav = output_path.replace('.mp3', '_temp.wav')
-            sf.write(temp_wav, audio, 24000)
             try:
-                subprocess.run(['ffmpeg', '-i', temp_wav, '-codec:a', 'libmp3lame', '-qscale:a', '2', '-y', output_path],
-                             capture_output=True, check=True)
-                os.remove(temp_wav)
-            except:
-                os.rename(temp_wav, output_path)
+                self._encode_mp3(audio, output_path)
+            except Exception as e:
+                print(f"   ⚠ MP3 encode failed ({e}), writing WAV data instead")
+                sf.write(output_path, audio, 24000, format='WAV')
         else:
             sf.write(output_path, audio, 24000)
-        
+
         print(f"✓ Audio generated: {output_path}")
         return output_path
+
+    def _infer(self, text: str):
+        '''Run TTS inference with the cached voice embedding when available.'''
+        with torch.inference_mode(), torch.autocast(device_type=self.device, dtype=torch.float16,
+                                                    enabled=self.device == "cuda"):
+            if self._voice_emb is not None:
+                return self.tts.infer(text=text, voice_embedding=self._voice_emb, temperature=0.8, top_k=50)
+            return self.tts.infer(text=text, voice=self.current_voice, temperature=0.8, top_k=50)
+
+    def _infer_sentences(self, sentences):
+        '''Synthesize sentences separately and join them with short silence gaps.
+
+        Autoregressive decoding scales superlinearly with input length, so many
+        short sequences beat one long blob; infer_batch is used when Vieneu has it.
+        '''
+        if hasattr(self.tts, 'infer_batch'):
+            try:
+                with torch.inference_mode():
+                    pieces = self.tts.infer_batch(texts=sentences, voice=self.current_voice,
+                                                  temperature=0.8, top_k=50)
+            except Exception:
+                pieces = [self._infer(s) for s in sentences]
+        else:
+            pieces = [self._infer(s) for s in sentences]
+
+        silence = np.zeros(int(0.15 * 24000), dtype=np.float32)
+        parts = []
+        for i, piece in enumerate(pieces):
+            parts.append(np.asarray(piece, dtype=np.float32).reshape(-1))
+            if i < len(pieces) - 1:
+                parts.append(silence)
+        return np.concatenate(parts)
+
+    def _encode_mp3(self, audio, output_path: str):
+        '''Encode PCM to MP3 in-process via lameenc, or by piping to ffmpeg stdin.'''
+        pcm = (np.asarray(audio) * 32767).clip(-32768, 32767).astype('<i2')
+
+        if lameenc is not None:
+            encoder = lameenc.Encoder()
+            encoder.set_bit_rate(128)
+            encoder.set_in_sample_rate(24000)
+            encoder.set_channels(1)
+            encoder.set_quality(2)
+            mp3 = encoder.encode(pcm.tobytes()) + encoder.flush()
+            with open(output_path, 'wb') as f:
+                f.write(mp3)
+            return
+
+        proc = subprocess.Popen(
+            ['ffmpeg', '-f', 's16le', '-ar', '24000', '-ac', '1', '-i', 'pipe:0',
+             '-codec:a', 'libmp3lame', '-qscale:a', '2', '-y', output_path],
+            stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        proc.stdin.write(pcm.tobytes())
+        proc.stdin.close()
+        if proc.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with code {proc.returncode}")
     
     def get_audio_duration(self, audio_path: str) -> float:
-        '''Get audio duration in seconds.'''
+        '''Get audio duration in seconds from the file header (no full decode).'''
+        try:
+            info = sf.info(audio_path)
+            return info.frames / info.samplerate
+        except:
+            pass
         try:
-            data, rate = sf.read(audio_path)
-            return len(data) / rate
+            from mutagen.mp3 import MP3
+            return MP3(audio_path).info.length
         except:
             result = subprocess.run(['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
                                    '-of', 'default=noprint_wrappers=1:nokey=1', audio_path],
@@ -0,0 +1,57 @@
+"""
+Text Normalize Module - shared cleanup pipeline for LLM output.
+
+One compiled substitution list replaces the regex logic that was previously
+duplicated between core._clean_text and main._final_cleanup.
+"""
+import re
+import functools
+from typing import Callable, List, Pattern, Tuple, Union
+
+# The long Vietnamese character classes are expensive to re-parse, so every
+# pattern here is compiled once at import.
+_VN_LOWER = 'a-zàáảãạăắằẳẵặâấầẩẫậèéẻẽẹêếềểễệìíỉĩịòóỏõọôốồổỗộơớờởỡợùúủũụưứừửữựỳýỷỹỵđ'
+_VN_UPPER = 'A-ZÀÁẢÃẠĂẮẰẲẴẶÂẤẦẨẪẬÈÉẺẼẸÊẾỀỂỄỆÌÍỈĨỊÒÓỎÕỌÔỐỒỔỖỘƠỚỜỞỠỢÙÚỦŨỤƯỨỪỬỮỰỲÝỶỸỴĐ'
+
+_RE_NUM_DOT = re.compile(r'(\d+)\.\s*(\d{3})')
+# Lookaround variant removes every thousands separator in one left-to-right pass
+_RE_NUM_DOT_SEP = re.compile(r'(?<=\d)\.\s*(?=\d{3})')
+_RE_COMMA_GLUE = re.compile(r',([^\s])')
+_RE_LOWER_UPPER = re.compile(rf'([{_VN_LOWER}])([{_VN_UPPER}])')
+_RE_N_KHOI = re.compile(r'([nN])([kK]hởi)')
+_RE_SUFFIX_GLUE = re.compile(rf'(án|ến|ông|ình|ất|ệt|ực)([{_VN_LOWER}]{{2,}})')
+_RE_DATE3 = re.compile(r'\b(\d{1,2})/(\d{1,2})/(\d{4})\b')
+_RE_DATE2 = re.compile(r'\b(\d{1,2})/(\d{1,2})\b')
+_RE_WS = re.compile(r'\s+')
+
+
+def _rewrite_date3(m) -> str:
+    return f"{'mùng' if int(m.group(1)) <= 10 else 'ngày'} {m.group(1)} tháng {m.group(2)} năm {m.group(3)}"
+
+
+def _rewrite_date2(m) -> str:
+    return f"{'mùng' if int(m.group(1)) <= 10 else 'ngày'} {m.group(1)} tháng {m.group(2)}"
+
+
+NORMALIZERS: List[Tuple[Pattern, Union[str, Callable]]] = [
+    (_RE_NUM_DOT_SEP, ''),
+    (_RE_COMMA_GLUE, r', \1'),
+    (_RE_LOWER_UPPER, r'\1 \2'),
+    (_RE_N_KHOI, r'\1 \2'),
+    (_RE_SUFFIX_GLUE, r'\1 \2'),
+    (_RE_DATE3, _rewrite_date3),
+    (_RE_DATE2, _rewrite_date2),
+    (_RE_WS, ' '),
+]
+
+
+@functools.lru_cache(maxsize=512)
+def normalize(text: str) -> str:
+    '''Run the shared cleanup substitutions and end on a complete sentence.'''
+    for pattern, repl in NORMALIZERS:
+        text = pattern.sub(repl, text)
+    text = text.strip()
+    if text and text[-1] not in '.!?':
+        last = max(text.rfind('.'), text.rfind('!'), text.rfind('?'))
+        text = text[:last+1] if last > len(text)*0.7 else text + '.'
+    return text